@@ -1,22 +1,62 @@
 import os
+import re
 import sys
+import bisect
 import tempfile
 import uuid
 import json
 import time
+import struct
+import concurrent.futures
 from tkinter import *
 from tkinter import filedialog, messagebox, colorchooser, simpledialog, font, ttk
 
+try:
+    # C-backed encoder; journal appends are the hottest serialization path.
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        # dumps + one write beats json.dump's many small writes, and the
+        # compact separators shave bytes off every journal record
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    _json_loads = json.loads
+
 AUTOSAVE_INTERVAL_MS = 30_000  # autosave every 30 seconds
+AUTOSAVE_MAX_INTERVAL_MS = 300_000  # back off to at most 5 minutes for slow writes
 AUTOSAVE_PREFIX = "advanced_text_editor_autosave_"
-AUTOSAVE_META_EXT = ".meta.json"
+AUTOSAVE_META_EXT = ".meta.json"  # legacy sidecar, still cleaned up on remove
+AUTOSAVE_JOURNAL_EXT = ".journal"
+AUTOSAVE_MAGIC = b"TXTR"
+# magic + float timestamp + path length + title length, then the two strings
+AUTOSAVE_HEADER = struct.Struct("<4sdHH")
+AUTOSAVE_PACK_PREFIX = "texter_autosave_"
+AUTOSAVE_PACK_EXT = ".pack"
+# pack index entry: id length + record offset + record length, then the id
+PACK_ENTRY = struct.Struct("<HQI")
+# pack trailer at EOF: magic + record count + index size
+PACK_TRAILER = struct.Struct("<4sII")
+JOURNAL_FLUSH_MS = 1_000  # batch journal appends for up to a second
+JOURNAL_COMPACT_FACTOR = 2  # snapshot early once the journal outgrows the doc
+STATUS_DEBOUNCE_MS = 200  # recompute word/char counts after typing pauses
+TAB_POOL_MAX = 8  # closed-tab widgets kept around for reuse
 
 class TabData:
     def __init__(self, frame, text_widget, file_path=None, autosave_id=None):
         self.frame = frame
         self.text = text_widget
         self.file_path = file_path
+        self.cached_basename = os.path.basename(file_path) if file_path else None
+        self.title = "Untitled"  # mirrors the notebook tab text
         self.autosave_id = autosave_id or str(uuid.uuid4())
+        self.dirty = False  # set via _mark_dirty whenever the buffer changes
+        self.pending_view_sync = False  # wrap/theme changed while hidden
+        self.lines = [""]  # Python-side mirror of the buffer, by line
+        self.content_cache = None  # joined mirror, invalidated on edit
+        self.journal_pending = []  # edit ops not yet flushed to disk
+        self.journal_bytes = 0  # bytes appended since the last snapshot
+        self.last_snapshot_len = 0
 
 class AdvancedEditor:
     def __init__(self, root):
@@ -26,10 +66,13 @@ class AdvancedEditor:
 
         self.notebook = ttk.Notebook(root)
         self.notebook.grid(row=0, column=0, sticky="nsew")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         root.rowconfigure(0, weight=1)
         root.columnconfigure(0, weight=1)
 
         self.tabs = {}  # tab_id -> TabData
+        self._text_tabdata = {}  # Text widget -> its current TabData
+        self._tab_pool = []  # recycled (frame, text) pairs from closed tabs
         self.current_font = StringVar(value="Helvetica")
         self.current_font_size = IntVar(value=12)
         self.bold_active = False
@@ -37,8 +80,16 @@ class AdvancedEditor:
         self.underline_active = False
         self.wrap_on = BooleanVar(value=True)
         self.dark_mode = BooleanVar(value=False)
+        # One Font shared by every tab: toggling a style mutates it in
+        # place, so Tk restyles all tabs without any per-tab reconfigure.
+        self._shared_font = font.Font(family=self.current_font.get(),
+                                      size=self.current_font_size.get())
 
         self.file_menu_actions = {}
+        self._journal_flush_after = None
+        self._status_after = None
+        self._autosave_pending = None
+        self._autosave_interval_ms = AUTOSAVE_INTERVAL_MS
         self._build_menus()
         self._build_statusbar()
         self._bind_shortcuts()
@@ -46,24 +97,40 @@ class AdvancedEditor:
 
         # Autosave setup
         self.autosave_dir = tempfile.gettempdir()
-        self._recover_autosaves_on_startup()
-        self._schedule_autosave()
+        # Per-session pack file: concurrent instances never clobber each
+        # other, and packs from earlier sessions survive untouched until
+        # the user explicitly recovers them.
+        self._autosave_pack_path = os.path.join(
+            self.autosave_dir, AUTOSAVE_PACK_PREFIX + uuid.uuid4().hex + AUTOSAVE_PACK_EXT)
+        # autosave_id -> packed record bytes; owned by the worker thread
+        self._autosave_snapshots = {}
+        # Single worker so autosave writes happen off the Tk main thread
+        # but never race each other.
+        self._autosave_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Defer recovery until the event loop is spinning: the window and
+        # first tab appear immediately instead of blocking __init__ on
+        # directory scans and a modal dialog.
+        self.root.after_idle(self._recover_autosaves_on_startup)
 
     # ---------- Tab management ----------
     def _create_tab(self, title="Untitled", content="", file_path=None, recovered=False, autosave_id=None):
-        frame = Frame(self.notebook)
-        text = Text(frame, undo=True, wrap="word" if self.wrap_on.get() else "none")
-        text.pack(fill="both", expand=True)
-        text.insert("1.0", content)
-        text.bind("<KeyRelease>", self._on_text_change)
-        text.bind("<ButtonRelease>", self._update_status)
-        apply_font = font.Font(family=self.current_font.get(), size=self.current_font_size.get(),
-                               weight="bold" if self.bold_active else "normal",
-                               slant="italic" if self.italic_active else "roman",
-                               underline=1 if self.underline_active else 0)
-        text.config(font=apply_font)
-        tab_id = self.notebook.add(frame, text=title if not recovered else f"Recovered - {title}")
+        if self._tab_pool:
+            # Reuse a recycled widget pair: building a Text (undo stack,
+            # tags, bindings) dominates the cost of opening a tab.
+            frame, text = self._tab_pool.pop()
+        else:
+            frame = Frame(self.notebook)
+            text = Text(frame, undo=True, wrap="word" if self.wrap_on.get() else "none")
+            text.pack(fill="both", expand=True)
+            text.bind("<KeyRelease>", self._on_text_change)
+            text.bind("<ButtonRelease>", self._update_status)
+            text.config(font=self._shared_font)
         td = TabData(frame, text, file_path=file_path, autosave_id=autosave_id)
+        self._install_edit_hook(td)
+        text.insert("1.0", content)
+        self._apply_view_settings(td)
+        td.title = title if not recovered else f"Recovered - {title}"
+        tab_id = self.notebook.add(frame, text=td.title)
         self.tabs[frame] = td
         self.notebook.select(frame)
         self._update_status()
@@ -80,9 +147,26 @@ class AdvancedEditor:
                 self._remove_autosave_file(td)
                 self.notebook.forget(frame)
                 del self.tabs[frame]
+                self._recycle_tab(td)
                 if not self.tabs:
                     self._create_tab()
 
+    def _recycle_tab(self, td):
+        # Detach first so the reset below is not mirrored or journaled.
+        self._text_tabdata.pop(td.text, None)
+        if len(self._tab_pool) >= TAB_POOL_MAX:
+            td.frame.destroy()
+            return
+        try:
+            td.text.delete("1.0", "end")
+            td.text.edit_reset()
+            td.text.edit_modified(False)
+            td.text.tag_remove("highlight", "1.0", "end")
+        except Exception:
+            td.frame.destroy()
+            return
+        self._tab_pool.append((td.frame, td.text))
+
     def _new_tab(self, event=None):
         self._create_tab()
 
@@ -100,7 +184,8 @@ class AdvancedEditor:
         if not td:
             return
         if td.file_path:
-            self._write_file(td.file_path, td.text.get("1.0", "end-1c"))
+            self._write_file(td.file_path, self._tab_content(td))
+            td.dirty = False
             self._update_tab_title(td)
         else:
             self._save_current_tab_as()
@@ -112,7 +197,8 @@ class AdvancedEditor:
         path = filedialog.asksaveasfilename()
         if not path:
             return
-        self._write_file(path, td.text.get("1.0", "end-1c"))
+        self._write_file(path, self._tab_content(td))
+        td.dirty = False
         td.file_path = path
         self._update_tab_title(td)
         self._remove_autosave_file(td)  # clear autosave metadata since user saved
@@ -123,8 +209,9 @@ class AdvancedEditor:
         messagebox.showinfo("Saved", f"Saved to {path}")
 
     def _update_tab_title(self, td):
-        title = os.path.basename(td.file_path) if td.file_path else "Untitled"
-        self.notebook.tab(td.frame, text=title)
+        td.cached_basename = os.path.basename(td.file_path) if td.file_path else None
+        td.title = td.cached_basename or "Untitled"
+        self.notebook.tab(td.frame, text=td.title)
 
     def _get_current_tabdata(self):
         sel = self.notebook.select()
@@ -140,97 +227,442 @@ class AdvancedEditor:
         self.status_label.grid(row=1, column=0, sticky="we")
 
     def _update_status(self, event=None):
+        self._status_after = None
         td = self._get_current_tabdata()
         if not td:
             self.status.set("")
             return
         cursor_pos = td.text.index(INSERT)
         row, col = cursor_pos.split(".")
-        content = td.text.get("1.0", "end-1c")
-        words = len(content.split())
+        # Counts come from the Python-side mirror, recomputed only once
+        # typing pauses -- no buffer ever crosses the Tcl boundary here.
+        content = self._tab_content(td)
         chars = len(content)
-        tab_title = os.path.basename(td.file_path) if td.file_path else self.notebook.tab(td.frame, option="text")
+        words = len(content.split())
+        tab_title = td.cached_basename or td.title
         self.status.set(f"{tab_title} | Ln {row} | Col {int(col)+1} | Words {words} | Chars {chars}")
 
     def _on_text_change(self, event=None):
-        self._update_status()
+        # Dirty marking lives in _record_edit, which sees actual buffer
+        # changes; KeyRelease also fires for plain cursor movement.
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+        self._status_after = self.root.after(STATUS_DEBOUNCE_MS, self._update_status)
 
     # ---------- Autosave ----------
-    def _autosave_all_tabs(self):
+    @staticmethod
+    def _pack_meta(meta):
+        pb = (meta.get("file_path") or "").encode("utf-8")
+        tb = (meta.get("title") or "").encode("utf-8")
+        return AUTOSAVE_HEADER.pack(AUTOSAVE_MAGIC, meta.get("timestamp", 0.0),
+                                    len(pb), len(tb)) + pb + tb
+
+    @staticmethod
+    def _unpack_meta(raw):
+        # Returns (meta, content_offset); None for pre-header autosave files.
+        if len(raw) < AUTOSAVE_HEADER.size or not raw.startswith(AUTOSAVE_MAGIC):
+            return None
+        magic, ts, plen, tlen = AUTOSAVE_HEADER.unpack_from(raw)
+        off = AUTOSAVE_HEADER.size
+        path = raw[off:off + plen].decode("utf-8")
+        title = raw[off + plen:off + plen + tlen].decode("utf-8")
+        meta = {"file_path": path or None, "timestamp": ts, "title": title}
+        return meta, off + plen + tlen
+
+    def _autosave_path(self, td):
+        return os.path.join(self.autosave_dir, AUTOSAVE_PREFIX + td.autosave_id + ".txt")
+
+    def _install_edit_hook(self, td):
+        # Interpose on the Tcl widget command so every insert/delete/replace
+        # is seen with exact indices -- <<Modified>> only says *something*
+        # changed, not where. Ops are journaled so a keystroke costs O(delta)
+        # bytes on disk instead of a full-buffer rewrite. The proxy looks
+        # its TabData up per call, so a recycled widget keeps one hook for
+        # life and only this mapping changes.
+        text = td.text
+        self._text_tabdata[text] = td
+        if getattr(text, "_edit_hook_installed", False):
+            return
+        text._edit_hook_installed = True
+        orig = text._w + "_orig"
+        text.tk.call("rename", text._w, orig)
+
+        def proxy(cmd, *args):
+            td = self._text_tabdata.get(text)
+            if td is not None and args and cmd in ("insert", "delete", "replace"):
+                try:
+                    self._record_edit(td, orig, cmd, args)
+                except Exception:
+                    # Never let bookkeeping break the edit itself, but a
+                    # missed op means the mirror can no longer be trusted.
+                    td.lines = None
+                    td.content_cache = None
+            result = text.tk.call((orig, cmd) + args)
+            if td is not None and cmd == "edit" and args and args[0] in ("undo", "redo"):
+                # Undo/redo mutate the buffer inside Tk without going
+                # through this command, so rebuild the mirror wholesale.
+                self._resync_mirror(td)
+            return result
+
+        text.tk.createcommand(text._w, proxy)
+
+    def _record_edit(self, td, orig, cmd, args):
+        tk_call = td.text.tk.call
+        if cmd == "insert":
+            if not args[1]:
+                return
+            op = {"t": time.time(), "ins": [str(tk_call(orig, "index", args[0])), args[1]]}
+        elif cmd == "delete":
+            spans = [str(tk_call(orig, "index", a)) for a in args[:2]]
+            op = {"t": time.time(), "del": spans}
+        else:  # replace
+            op = {"t": time.time(),
+                  "rep": [str(tk_call(orig, "index", args[0])),
+                          str(tk_call(orig, "index", args[1])), args[2]]}
+        self._apply_op_to_mirror(td, op)
+        td.journal_pending.append(op)
+        self._mark_dirty(td)
+        if self._journal_flush_after is None:
+            self._journal_flush_after = self.root.after(JOURNAL_FLUSH_MS, self._flush_journals)
+
+    # ---------- Buffer mirror ----------
+    # The mirror keeps the document as a Python list of lines, spliced on
+    # every proxied edit, so autosave, the status bar and Find/Replace read
+    # it instead of copying the whole buffer out of Tcl each time.
+    @staticmethod
+    def _parse_mirror_index(lines, idx):
+        line, col = idx.split(".")
+        line, col = int(line) - 1, int(col)
+        if line >= len(lines):  # "end" resolves one line past the buffer
+            return len(lines) - 1, len(lines[-1])
+        return line, min(col, len(lines[line]))
+
+    @classmethod
+    def _mirror_insert(cls, lines, idx, s):
+        line, col = cls._parse_mirror_index(lines, idx)
+        cur = lines[line]
+        parts = s.split("\n")
+        if len(parts) == 1:
+            lines[line] = cur[:col] + s + cur[col:]
+        else:
+            lines[line:line + 1] = ([cur[:col] + parts[0]]
+                                    + parts[1:-1]
+                                    + [parts[-1] + cur[col:]])
+
+    @classmethod
+    def _mirror_delete(cls, lines, start, end=None):
+        l1, c1 = cls._parse_mirror_index(lines, start)
+        if end is None:  # single-char delete, possibly of a newline
+            if c1 < len(lines[l1]):
+                l2, c2 = l1, c1 + 1
+            elif l1 + 1 < len(lines):
+                l2, c2 = l1 + 1, 0
+            else:
+                return
+        else:
+            l2, c2 = cls._parse_mirror_index(lines, end)
+        if (l2, c2) < (l1, c1):
+            return
+        lines[l1:l2 + 1] = [lines[l1][:c1] + lines[l2][c2:]]
+
+    def _apply_op_to_mirror(self, td, op):
+        if td.lines is None:
+            return  # mirror lost; consumers fall back to text.get
+        try:
+            if "ins" in op:
+                self._mirror_insert(td.lines, *op["ins"])
+            elif "del" in op:
+                self._mirror_delete(td.lines, *op["del"])
+            elif "rep" in op:
+                start, end, s = op["rep"]
+                self._mirror_delete(td.lines, start, end)
+                self._mirror_insert(td.lines, start, s)
+        except Exception:
+            td.lines = None
+        td.content_cache = None
+
+    def _resync_mirror(self, td):
+        try:
+            content = td.text.get("1.0", "end-1c")
+        except Exception:
+            return
+        td.lines = content.split("\n")
+        td.content_cache = content
+        # The journal no longer matches the buffer either; record the full
+        # state so replay stays correct (undo/redo are rare, keystrokes
+        # are not).
+        td.journal_pending.append({"t": time.time(), "set": content})
+        self._mark_dirty(td)
+        if self._journal_flush_after is None:
+            self._journal_flush_after = self.root.after(JOURNAL_FLUSH_MS, self._flush_journals)
+
+    def _tab_content(self, td):
+        if td.lines is None:
+            return td.text.get("1.0", "end-1c")
+        if td.content_cache is None:
+            td.content_cache = "\n".join(td.lines)
+        return td.content_cache
+
+    def _mark_dirty(self, td):
+        # Arm the (single) autosave timer only on the clean->dirty edge;
+        # an idle editor keeps no timer running and does zero work.
+        td.dirty = True
+        if self._autosave_pending is None:
+            self._autosave_pending = self.root.after(self._autosave_interval_ms,
+                                                     self._autosave_dirty_tabs)
+
+    def _flush_journals(self):
+        self._journal_flush_after = None
+        batch = []
         for td in list(self.tabs.values()):
+            if not td.journal_pending:
+                continue
+            payload = b"".join(_json_dumps(op) + b"\n" for op in td.journal_pending)
+            td.journal_pending = []
+            # Journal outgrew the document: compact to a fresh snapshot now
+            # instead of letting replay cost grow without bound. The
+            # snapshot already contains these ops, so they must NOT also be
+            # appended behind it -- the worker would truncate the journal
+            # and then re-add them, and recovery would replay them twice.
+            if td.journal_bytes + len(payload) > JOURNAL_COMPACT_FACTOR * max(td.last_snapshot_len, 2048):
+                snap = self._snapshot_tab(td)
+                if snap:
+                    self._autosave_pool.submit(self._write_autosave_batch, [snap])
+                    continue
+            td.journal_bytes += len(payload)
+            batch.append((td, payload))
+        if batch:
+            self._autosave_pool.submit(self._append_journal_batch, batch)
+
+    def _append_journal_batch(self, batch):
+        for td, payload in batch:
             try:
-                content = td.text.get("1.0", "end-1c")
-                fname = AUTOSAVE_PREFIX + td.autosave_id + ".txt"
-                fpath = os.path.join(self.autosave_dir, fname)
-                with open(fpath, "w", encoding="utf-8") as f:
-                    f.write(content)
-                meta = {
-                    "file_path": td.file_path,
-                    "timestamp": time.time(),
-                    "title": os.path.basename(td.file_path) if td.file_path else self.notebook.tab(td.frame, option="text")
-                }
-                meta_path = fpath + AUTOSAVE_META_EXT
-                with open(meta_path, "w", encoding="utf-8") as m:
-                    json.dump(meta, m)
+                fd = os.open(self._autosave_path(td) + AUTOSAVE_JOURNAL_EXT,
+                             os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+                try:
+                    os.write(fd, memoryview(payload))
+                finally:
+                    os.close(fd)
             except Exception:
                 pass  # fail autosave silently
-        self._schedule_autosave()
 
-    def _schedule_autosave(self):
-        self.root.after(AUTOSAVE_INTERVAL_MS, self._autosave_all_tabs)
+    def _replay_journal(self, td, jpath):
+        try:
+            with open(jpath, "rb") as j:
+                lines = j.readlines()
+        except Exception:
+            return
+        for line in lines:
+            try:
+                op = _json_loads(line)
+                if "ins" in op:
+                    td.text.insert(*op["ins"])
+                elif "del" in op:
+                    td.text.delete(*op["del"])
+                elif "rep" in op:
+                    td.text.replace(*op["rep"])
+                elif "set" in op:
+                    td.text.delete("1.0", "end")
+                    td.text.insert("1.0", op["set"])
+            except Exception:
+                continue  # skip a torn/corrupt trailing record
+
+    def _autosave_dirty_tabs(self):
+        # Fires only when something was edited since the last flush; the
+        # next edit re-arms it. Not rescheduled here on purpose.
+        self._autosave_pending = None
+        snapshots = []
+        for td in list(self.tabs.values()):
+            if td.dirty:
+                snap = self._snapshot_tab(td)
+                if snap:
+                    snapshots.append(snap)
+        if snapshots:
+            self._autosave_pool.submit(self._write_autosave_batch, snapshots)
+
+    def _snapshot_tab(self, td):
+        # Tk calls must stay on the main thread: snapshot the buffer here,
+        # then hand the slow file I/O to the background worker.
+        try:
+            content = self._tab_content(td)
+            meta = {
+                "file_path": td.file_path,
+                "timestamp": time.time(),
+                "title": td.cached_basename or td.title
+            }
+        except Exception:
+            return None  # fail autosave silently
+        td.dirty = False
+        # Pending ops are contained in this snapshot already.
+        td.journal_pending = []
+        td.last_snapshot_len = len(content)
+        return (td, content, meta)
+
+    def _write_autosave_batch(self, snapshots):
+        t0 = time.perf_counter()
+        for td, content, meta in snapshots:
+            self._autosave_snapshots[td.autosave_id] = self._pack_meta(meta) + content.encode("utf-8")
+        self._rewrite_autosave_pack()
+        for td, content, meta in snapshots:
+            try:
+                # The snapshot supersedes everything journaled so far.
+                os.close(os.open(self._autosave_path(td) + AUTOSAVE_JOURNAL_EXT,
+                                 os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600))
+                td.journal_bytes = 0
+            except Exception:
+                pass  # fail autosave silently
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        # Back off when writes are slow (big buffers, network temp dirs):
+        # aim to spend well under 2% of wall time writing.
+        self._autosave_interval_ms = min(AUTOSAVE_MAX_INTERVAL_MS,
+                                         max(AUTOSAVE_INTERVAL_MS, int(elapsed_ms * 50)))
+
+    def _rewrite_autosave_pack(self):
+        # All tabs' latest snapshots live in one segmented file, written
+        # with a single open + write instead of two files per tab. Clean
+        # tabs' records are reused from the cache, so only the dirty ones
+        # cost a fresh encode.
+        try:
+            if not self._autosave_snapshots:
+                try:
+                    os.remove(self._autosave_pack_path)
+                except OSError:
+                    pass
+                return
+            records, index = [], []
+            offset = 0
+            for autosave_id, record in self._autosave_snapshots.items():
+                idb = autosave_id.encode("utf-8")
+                index.append(PACK_ENTRY.pack(len(idb), offset, len(record)) + idb)
+                records.append(record)
+                offset += len(record)
+            index_blob = b"".join(index)
+            parts = records + [index_blob,
+                               PACK_TRAILER.pack(AUTOSAVE_MAGIC, len(records), len(index_blob))]
+            # Raw fd writes skip the io buffering layers; writev hands the
+            # cached record buffers to the kernel without concatenating.
+            fd = os.open(self._autosave_pack_path,
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                if hasattr(os, "writev"):
+                    os.writev(fd, parts)
+                else:  # Windows: still a single write of one buffer
+                    os.write(fd, memoryview(b"".join(parts)))
+            finally:
+                os.close(fd)
+        except Exception:
+            pass  # fail autosave silently
+
+    def _read_autosave_pack(self, pack_path):
+        try:
+            with open(pack_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return []
+        if len(raw) < PACK_TRAILER.size:
+            return []
+        magic, count, index_size = PACK_TRAILER.unpack_from(raw, len(raw) - PACK_TRAILER.size)
+        if magic != AUTOSAVE_MAGIC:
+            return []
+        index = raw[len(raw) - PACK_TRAILER.size - index_size:len(raw) - PACK_TRAILER.size]
+        out, pos = [], 0
+        for _ in range(count):
+            try:
+                idlen, off, length = PACK_ENTRY.unpack_from(index, pos)
+                pos += PACK_ENTRY.size
+                autosave_id = index[pos:pos + idlen].decode("utf-8")
+                pos += idlen
+                unpacked = self._unpack_meta(raw[off:off + length])
+                if not unpacked:
+                    continue
+                meta, content_off = unpacked
+                content = raw[off + content_off:off + length].decode("utf-8", errors="replace")
+                out.append((autosave_id, meta, content))
+            except Exception:
+                break  # torn index; salvage what we parsed so far
+        return out
+
+    def _discard_snapshot(self, autosave_id):
+        if self._autosave_snapshots.pop(autosave_id, None) is not None:
+            self._rewrite_autosave_pack()
 
     def _list_autosave_files(self):
-        files = []
-        for name in os.listdir(self.autosave_dir):
-            if name.startswith(AUTOSAVE_PREFIX) and name.endswith(".txt"):
-                files.append(os.path.join(self.autosave_dir, name))
-        return files
+        # One scandir pass: DirEntry carries the stat info, so skipping
+        # empty files costs no extra syscall. A journal with no snapshot
+        # means the tab never reached its first autosave; its edits replay
+        # onto an empty buffer. Pack files from earlier sessions are
+        # collected in the same pass.
+        files, journal_bases, packs = [], [], []
+        for entry in os.scandir(self.autosave_dir):
+            name = entry.name
+            is_pack = name.startswith(AUTOSAVE_PACK_PREFIX) and name.endswith(AUTOSAVE_PACK_EXT)
+            if not is_pack and not name.startswith(AUTOSAVE_PREFIX):
+                continue
+            if not entry.is_file(follow_symlinks=False) or entry.stat().st_size == 0:
+                continue
+            if is_pack:
+                packs.append(entry.path)
+            elif name.endswith(".txt"):
+                files.append(entry.path)
+            elif name.endswith(".txt" + AUTOSAVE_JOURNAL_EXT):
+                journal_bases.append(entry.path[:-len(AUTOSAVE_JOURNAL_EXT)])
+        files.extend(base for base in journal_bases if base not in files)
+        return files, packs
 
     def _recover_autosaves_on_startup(self):
-        autosave_files = self._list_autosave_files()
-        if not autosave_files:
-            return
-        to_recover = []
+        autosave_files, pack_files = self._list_autosave_files()
+        to_recover = {}  # autosave_id -> (meta, content)
+        for pack_path in pack_files:
+            for autosave_id, meta, content in self._read_autosave_pack(pack_path):
+                to_recover[autosave_id] = (meta, content)
+        # Legacy per-tab snapshots and orphan journals.
         for fpath in autosave_files:
-            meta_path = fpath + AUTOSAVE_META_EXT
+            autosave_id = os.path.basename(fpath)[len(AUTOSAVE_PREFIX):-4]
+            if autosave_id in to_recover:
+                continue
             try:
-                with open(meta_path, "r", encoding="utf-8") as m:
-                    meta = json.load(m)
+                with open(fpath, "rb") as f:
+                    raw = f.read()
             except Exception:
-                meta = {"file_path": None, "title": "Recovered"}
-            to_recover.append((fpath, meta))
+                raw = b""
+            unpacked = self._unpack_meta(raw)
+            if unpacked:
+                meta, off = unpacked
+                content = raw[off:].decode("utf-8", errors="replace")
+            else:
+                # Pre-header autosave: whole file is content, meta in sidecar.
+                content = raw.decode("utf-8", errors="replace")
+                try:
+                    with open(fpath + AUTOSAVE_META_EXT, "r", encoding="utf-8") as m:
+                        meta = json.load(m)
+                except Exception:
+                    meta = {"file_path": None, "title": "Recovered"}
+            to_recover[autosave_id] = (meta, content)
         if not to_recover:
             return
         if not messagebox.askyesno("Recover files", f"Found {len(to_recover)} autosave file(s). Recover them?"):
-            return
-        for fpath, meta in to_recover:
-            try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception:
-                content = ""
+            return  # declined: leave everything on disk, re-prompt next launch
+        for autosave_id, (meta, content) in to_recover.items():
             title = meta.get("title") or "Recovered"
             file_path = meta.get("file_path")
-            autosave_id = os.path.basename(fpath)[len(AUTOSAVE_PREFIX):-4]
-            self._create_tab(title=title, content=content, file_path=file_path, recovered=True, autosave_id=autosave_id)
-            # remove autosave after recovery
+            td = self._create_tab(title=title, content=content, file_path=file_path, recovered=True, autosave_id=autosave_id)
+            self._replay_journal(td, self._autosave_path(td) + AUTOSAVE_JOURNAL_EXT)
+            self._remove_autosave_file(td)
+        for pack_path in pack_files:
             try:
-                os.remove(fpath)
-                mp = fpath + AUTOSAVE_META_EXT
-                if os.path.exists(mp):
-                    os.remove(mp)
-            except Exception:
+                os.remove(pack_path)
+            except OSError:
                 pass
 
     def _remove_autosave_file(self, td):
-        fname = AUTOSAVE_PREFIX + td.autosave_id + ".txt"
-        fpath = os.path.join(self.autosave_dir, fname)
-        metapath = fpath + AUTOSAVE_META_EXT
-        for p in (fpath, metapath):
+        self._autosave_pool.submit(self._discard_snapshot, td.autosave_id)
+        fpath = self._autosave_path(td)
+        for p in (fpath, fpath + AUTOSAVE_META_EXT, fpath + AUTOSAVE_JOURNAL_EXT):
+            # unlink straight away; a missing file is the common case and
+            # the exists() probe was just a second syscall
             try:
-                if os.path.exists(p):
-                    os.remove(p)
-            except Exception:
+                os.remove(p)
+            except OSError:
                 pass
 
     # ---------- Menus and tools ----------
@@ -259,16 +691,41 @@ class AdvancedEditor:
         edit_menu.add_command(label="Select All", command=self._select_all, accelerator="Ctrl+A")
         edit_menu.add_command(label="Clear All", command=self._clear_all)
 
-        format_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Format", menu=format_menu)
+        self._deferred_menu(menu_bar, "Format", self._populate_format_menu)
+
+        view_menu = Menu(menu_bar, tearoff=0)
+        menu_bar.add_cascade(label="View", menu=view_menu)
+        view_menu.add_checkbutton(label="Word Wrap", variable=self.wrap_on, command=self._toggle_wrap)
+        view_menu.add_checkbutton(label="Dark Mode", variable=self.dark_mode, command=self._toggle_dark_mode)
+
+        self._deferred_menu(menu_bar, "Tools", self._populate_tools_menu)
+        self._deferred_menu(menu_bar, "Help", self._populate_help_menu)
+
+    def _deferred_menu(self, menu_bar, label, populate):
+        # Build the cascade now but its items only on first post, keeping
+        # startup free of item/closure construction for menus rarely used.
+        menu = Menu(menu_bar, tearoff=0)
+
+        def _populate_once():
+            menu.configure(postcommand="")
+            populate(menu)
+
+        menu.configure(postcommand=_populate_once)
+        menu_bar.add_cascade(label=label, menu=menu)
+        return menu
+
+    def _populate_format_menu(self, format_menu):
+        # Radiobuttons carry a value= and share one bound method: Tk sets
+        # the variable before invoking the command, so no per-item lambda
+        # is needed.
         font_menu = Menu(format_menu, tearoff=0)
         for f in ["Helvetica", "Courier", "Times", "Arial", "Consolas"]:
-            font_menu.add_radiobutton(label=f, variable=self.current_font, command=lambda f=f: self._set_font_family(f))
+            font_menu.add_radiobutton(label=f, variable=self.current_font, value=f, command=self._apply_format)
         format_menu.add_cascade(label="Font", menu=font_menu)
 
         size_menu = Menu(format_menu, tearoff=0)
         for s in [8, 10, 12, 14, 16, 18, 20, 24, 28]:
-            size_menu.add_radiobutton(label=str(s), variable=self.current_font_size, command=lambda s=s: self._set_font_size(s))
+            size_menu.add_radiobutton(label=str(s), variable=self.current_font_size, value=s, command=self._apply_format)
         format_menu.add_cascade(label="Size", menu=size_menu)
         format_menu.add_command(label="Text Color", command=self._set_text_color)
         format_menu.add_separator()
@@ -276,18 +733,14 @@ class AdvancedEditor:
         format_menu.add_command(label="Italic", command=self._toggle_italic)
         format_menu.add_command(label="Underline", command=self._toggle_underline)
 
-        view_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_checkbutton(label="Word Wrap", variable=self.wrap_on, command=self._toggle_wrap)
-        view_menu.add_checkbutton(label="Dark Mode", variable=self.dark_mode, command=self._toggle_dark_mode)
-
-        tools_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Tools", menu=tools_menu)
+    def _populate_tools_menu(self, tools_menu):
         tools_menu.add_command(label="Find / Replace", command=self._find_replace)
 
-        help_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=lambda: messagebox.showinfo("About", "Texter - Text Editor\nBuilt with Python\nBy Shreyash Srivastva"))
+    def _populate_help_menu(self, help_menu):
+        help_menu.add_command(label="About", command=self._show_about)
+
+    def _show_about(self):
+        messagebox.showinfo("About", "Texter - Text Editor\nBuilt with Python\nBy Shreyash Srivastva")
 
     # ---------- Edit helpers ----------
     def _undo(self): 
@@ -316,34 +769,24 @@ class AdvancedEditor:
             td.text.delete("1.0", "end")
 
     # ---------- Format helpers ----------
-    def _apply_format_to_current(self):
-        td = self._get_current_tabdata()
-        f = font.Font(family=self.current_font.get(), size=self.current_font_size.get(),
-                      weight="bold" if self.bold_active else "normal",
-                      slant="italic" if self.italic_active else "roman",
-                      underline=1 if self.underline_active else 0)
-        if td:
-            td.text.config(font=f)
+    def _apply_format(self):
+        self._shared_font.configure(family=self.current_font.get(),
+                                    size=self.current_font_size.get(),
+                                    weight="bold" if self.bold_active else "normal",
+                                    slant="italic" if self.italic_active else "roman",
+                                    underline=1 if self.underline_active else 0)
 
     def _toggle_bold(self):
         self.bold_active = not self.bold_active
-        self._apply_format_to_current()
+        self._apply_format()
 
     def _toggle_italic(self):
         self.italic_active = not self.italic_active
-        self._apply_format_to_current()
+        self._apply_format()
 
     def _toggle_underline(self):
         self.underline_active = not self.underline_active
-        self._apply_format_to_current()
-
-    def _set_font_family(self, fam):
-        self.current_font.set(fam)
-        self._apply_format_to_current()
-
-    def _set_font_size(self, s):
-        self.current_font_size.set(s)
-        self._apply_format_to_current()
+        self._apply_format()
 
     def _set_text_color(self):
         color = colorchooser.askcolor()[1]
@@ -352,22 +795,55 @@ class AdvancedEditor:
             td.text.config(fg=color)
 
     # ---------- View helpers ----------
-    def _toggle_wrap(self):
-        td = self._get_current_tabdata()
+    def _apply_view_settings(self, td):
+        if self.dark_mode.get():
+            colors = {"bg": "#1e1e1e", "fg": "#ffffff", "insertbackground": "white"}
+        else:
+            colors = {"bg": "white", "fg": "black", "insertbackground": "black"}
+        td.text.config(wrap="word" if self.wrap_on.get() else "none", **colors)
+        td.pending_view_sync = False
+
+    def _mark_view_settings_changed(self):
+        # Reconfigure only the visible tab now; hidden tabs catch up when
+        # they are next selected, so a toggle is O(1) not O(open tabs).
+        current = self._get_current_tabdata()
         for td in self.tabs.values():
-            td.text.config(wrap="word" if self.wrap_on.get() else "none")
+            if td is current:
+                self._apply_view_settings(td)
+            else:
+                td.pending_view_sync = True
+
+    def _on_tab_changed(self, event=None):
+        td = self._get_current_tabdata()
+        if td and td.pending_view_sync:
+            self._apply_view_settings(td)
+
+    def _toggle_wrap(self):
+        self._mark_view_settings_changed()
 
     def _toggle_dark_mode(self):
+        self._mark_view_settings_changed()
         if self.dark_mode.get():
-            for td in self.tabs.values():
-                td.text.config(bg="#1e1e1e", fg="#ffffff", insertbackground="white")
             self.status_label.config(bg="#2e2e2e", fg="white")
         else:
-            for td in self.tabs.values():
-                td.text.config(bg="white", fg="black", insertbackground="black")
             self.status_label.config(bg="SystemButtonFace", fg="black")
 
     # ---------- Find/Replace ----------
+    @staticmethod
+    def _spans_to_indices(content, spans):
+        # Map character offsets to Tk "line.col" indices in pure Python so
+        # matching a large document costs one Tcl call, not one per match.
+        line_starts = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        indices = []
+        for off in spans:
+            line = bisect.bisect_right(line_starts, off) - 1
+            indices.append(f"{line + 1}.{off - line_starts[line]}")
+        return indices
+
     def _find_replace(self):
         find_str = simpledialog.askstring("Find", "Find:")
         if not find_str:
@@ -376,31 +852,52 @@ class AdvancedEditor:
         td = self._get_current_tabdata()
         if not td:
             return
-        content = td.text.get("1.0", "end-1c")
+        content = self._tab_content(td)
         if replace_str is not None:
-            new_content = content.replace(find_str, replace_str)
-            td.text.delete("1.0", "end")
-            td.text.insert("1.0", new_content)
+            offsets = []
+            for m in re.finditer(re.escape(find_str), content):
+                offsets.append(m.start())
+                offsets.append(m.end())
+            if offsets:
+                indices = self._spans_to_indices(content, offsets)
+                # Replace right-to-left so earlier indices stay valid; each
+                # match is edited in place instead of deleting and
+                # reinserting the whole document, which kept undo usable
+                # and forced a full redraw.
+                td.text.edit_separator()
+                for i in range(len(indices) - 2, -1, -2):
+                    td.text.replace(indices[i], indices[i + 1], replace_str)
+                td.text.edit_separator()
         else:
             td.text.tag_remove("highlight", "1.0", "end")
-            start = "1.0"
-            while True:
-                start = td.text.search(find_str, start, stopindex="end")
-                if not start:
-                    break
-                end = f"{start}+{len(find_str)}c"
-                td.text.tag_add("highlight", start, end)
-                start = end
+            offsets = []
+            for m in re.finditer(re.escape(find_str), content):
+                offsets.append(m.start())
+                offsets.append(m.end())
+            if offsets:
+                # tag_add takes many index pairs, so all matches land in
+                # one Tcl round-trip instead of a search call per match.
+                td.text.tag_add("highlight", *self._spans_to_indices(content, offsets))
             td.text.tag_config("highlight", background="yellow", foreground="black")
 
     # ---------- Shortcuts & exit ----------
     def _bind_shortcuts(self):
-        self.root.bind("<Control-t>", lambda e: self._new_tab())
-        self.root.bind("<Control-o>", lambda e: self._open_in_new_tab())
-        self.root.bind("<Control-s>", lambda e: self._save_current_tab())
-        self.root.bind("<Control-w>", lambda e: self._close_current_tab())
-        self.root.bind("<Control-q>", lambda e: self._exit_editor())
-        self.root.bind("<Control-a>", lambda e: self._select_all())
+        # Bind once at the Text class level with direct method references:
+        # no per-root lambda trampoline in the key path, and the "break"
+        # return keeps the widget's default handlers from double-firing.
+        self.root.bind_class("Text", "<Control-t>", self._kb_new_tab)
+        self.root.bind_class("Text", "<Control-o>", self._kb_open)
+        self.root.bind_class("Text", "<Control-s>", self._kb_save)
+        self.root.bind_class("Text", "<Control-w>", self._kb_close_tab)
+        self.root.bind_class("Text", "<Control-q>", self._kb_exit)
+        self.root.bind_class("Text", "<Control-a>", self._kb_select_all)
+
+    def _kb_new_tab(self, event): self._new_tab(); return "break"
+    def _kb_open(self, event): self._open_in_new_tab(); return "break"
+    def _kb_save(self, event): self._save_current_tab(); return "break"
+    def _kb_close_tab(self, event): self._close_current_tab(); return "break"
+    def _kb_exit(self, event): self._exit_editor(); return "break"
+    def _kb_select_all(self, event): self._select_all(); return "break"
 
     def _exit_editor(self):
         if messagebox.askyesno("Exit", "Close the editor?"):
@@ -409,6 +906,7 @@ class AdvancedEditor:
                 # if saved to disk then remove autosave
                 if td.file_path:
                     self._remove_autosave_file(td)
+            self._autosave_pool.shutdown(wait=False)
             self.root.destroy()
 
 if __name__ == "__main__":